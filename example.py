@@ -20,34 +20,34 @@ from src import (
 def create_example_data(filename: str = 'example_data.csv') -> None:
     """Create example traffic data for demonstration."""
     import numpy as np
-    from datetime import datetime, timedelta
-    
-    np.random.seed(42)
-    
-    start_date = datetime(2023, 1, 1)
-    dates = [start_date + timedelta(days=i) for i in range(500)]
-    
+
+    rng = np.random.default_rng(42)
+
+    # date_range allocates the datetime64 array directly instead of
+    # boxing 500 Python datetime objects.
+    dates = pd.date_range('2023-01-01', periods=500, freq='D')
+
     base_traffic = 500
     trend = np.linspace(0, 300, 500)
     weekly_seasonality = 50 * np.sin(2 * np.pi * np.arange(500) / 7)
     yearly_seasonality = 100 * np.sin(2 * np.pi * np.arange(500) / 365.25)
-    noise = np.random.normal(0, 30, 500)
-    
+    noise = rng.normal(0, 30, 500)
+
     clicks = base_traffic + trend + weekly_seasonality + yearly_seasonality + noise
     clicks = np.maximum(clicks, 100).astype(int)
-    
-    impressions = clicks * np.random.uniform(40, 60, 500)
+
+    impressions = clicks * rng.uniform(40, 60, 500)
     ctr = (clicks / impressions * 100)
-    position = np.random.uniform(10, 20, 500)
-    
+    position = rng.uniform(10, 20, 500)
+
     df = pd.DataFrame({
         'Date': dates,
         'Clicks': clicks,
         'Impressions': impressions.astype(int),
-        'CTR': [f'{x:.2f}%' for x in ctr],
+        'CTR': pd.Series(ctr).round(2).astype(str) + '%',
         'Position': np.round(position, 2)
     })
-    
+
     df.to_csv(filename, index=False)
     print(f"Example data created: {filename}")
 
@@ -51,13 +51,7 @@ def main(data_path: str, output_dir: str, forecast_days: int = 90) -> None:
     
     print("Creating visualizations...")
     visualizer = TrafficVisualizer(output_dir=output_path, config=Config())
-    visualizer.plot_forecast(df_processed, forecast, model.model)
-    visualizer.plot_components(model.model, forecast)
-    visualizer.plot_analysis(df_processed, analysis_results)
-    
-    if visualizer.config.create_dashboard:
-        print("Creating interactive dashboard...")
-        visualizer.create_interactive_dashboard(df_processed, forecast, analysis_results)
+    visualizer.render_all(df_processed, forecast, model.model, analysis_results)
     
     print("Saving predictions...")
     predictions_df = model.get_future_predictions(forecast, df_processed)
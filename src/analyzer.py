@@ -3,7 +3,8 @@
 from typing import Dict, List, Tuple, Any
 import pandas as pd
 import numpy as np
-from scipy import stats
+
+from ._kernels import traffic_stats
 
 
 class TrafficAnalyzer:
@@ -19,63 +20,95 @@ class TrafficAnalyzer:
         Returns:
             Dictionary containing analysis results
         """
+        # Extract y once as a contiguous float array; every numeric helper
+        # reads this single copy instead of re-materializing the column.
+        y = df['y'].to_numpy(dtype=np.float64)
+        day_of_week = df['ds'].dt.dayofweek.to_numpy(dtype=np.int64)
+        month = df['ds'].dt.month.to_numpy(dtype=np.int64)
+
+        # One fused sweep yields all the scalar moments plus the
+        # day-of-week and month aggregates consumed below.
+        stats = traffic_stats(y, day_of_week, month)
+
         results = {
-            'basic_stats': self._calculate_basic_stats(df),
+            'basic_stats': self._calculate_basic_stats(y, stats),
             'weekly_pattern': self._analyze_weekly_pattern(df),
             'monthly_pattern': self._analyze_monthly_pattern(df),
             'growth_metrics': self._calculate_growth_metrics(df),
-            'anomalies': self._detect_anomalies(df),
-            'seasonality_strength': self._calculate_seasonality_strength(df)
+            'anomalies': self._detect_anomalies(df, y, stats),
+            'seasonality_strength': self._calculate_seasonality_strength(stats, len(y))
         }
-        
+
         return results
-    
-    def _calculate_basic_stats(self, df: pd.DataFrame) -> Dict[str, float]:
+
+    def _calculate_basic_stats(self, y: np.ndarray, stats: Tuple) -> Dict[str, float]:
         """Calculate basic statistical metrics."""
+        mean, m2, y_min, y_max = stats[:4]
+        std = np.sqrt(m2 / (len(y) - 1))
         return {
-            'mean': df['y'].mean(),
-            'median': df['y'].median(),
-            'std': df['y'].std(),
-            'min': df['y'].min(),
-            'max': df['y'].max(),
-            'cv': df['y'].std() / df['y'].mean()
+            'mean': mean,
+            'median': self._fast_median(y),
+            'std': std,
+            'min': y_min,
+            'max': y_max,
+            'cv': std / mean
         }
     
+    @staticmethod
+    def _fast_median(y: np.ndarray) -> float:
+        """O(n) median via quickselect instead of a full sort."""
+        k = len(y) // 2
+        part = np.partition(y, k)
+        if len(y) % 2:
+            return part[k]
+        return 0.5 * (part[k] + part[:k].max())
+
     def _analyze_weekly_pattern(self, df: pd.DataFrame) -> pd.DataFrame:
         """Analyze weekly traffic patterns."""
-        df['day_name'] = df['ds'].dt.day_name()
-        weekly_avg = df.groupby('day_name')['y'].mean()
-        
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 
+        # Group on the integer day-of-week key; string day names are only
+        # attached to the 7-row result, never to the input frame.
+        weekly_avg = df.groupby(df['ds'].dt.dayofweek, sort=True)['y'].mean()
+        averages = weekly_avg.reindex(range(7)).to_numpy()
+
+        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday',
                      'Friday', 'Saturday', 'Sunday']
-        weekly_avg = weekly_avg.reindex(day_order)
-        
+
         weekly_pattern = pd.DataFrame({
             'day': day_order,
-            'average_clicks': weekly_avg.values,
-            'relative_strength': (weekly_avg.values / weekly_avg.mean() - 1) * 100
+            'average_clicks': averages,
+            'relative_strength': (averages / weekly_avg.mean() - 1) * 100
         })
-        
+
         return weekly_pattern
     
     def _analyze_monthly_pattern(self, df: pd.DataFrame) -> pd.DataFrame:
         """Analyze monthly traffic patterns by year-month periods."""
-        monthly_avg = df.groupby(df['ds'].dt.to_period('M'))['y'].mean()
-        
+        # Group on an integer year*12+month key rather than a PeriodIndex:
+        # int64 hash keys avoid allocating a Period object per row.
+        year = df['ds'].dt.year.to_numpy()
+        month = df['ds'].dt.month.to_numpy()
+        monthly_avg = df['y'].groupby(year * 12 + (month - 1)).mean()
+
+        keys = monthly_avg.index.to_numpy()
+        averages = monthly_avg.to_numpy()
+
         monthly_pattern = pd.DataFrame({
-            'year_month': monthly_avg.index.astype(str),
-            'average_clicks': monthly_avg.values,
-            'relative_strength': ((monthly_avg.values / monthly_avg.mean()) - 1) * 100
+            'year_month': [f'{k // 12}-{k % 12 + 1:02d}' for k in keys],
+            'average_clicks': averages,
+            'relative_strength': ((averages / averages.mean()) - 1) * 100
         })
-        
+
         return monthly_pattern
     
     def _calculate_growth_metrics(self, df: pd.DataFrame) -> Dict[str, float]:
         """Calculate growth-related metrics."""
-        first_30_days = df.head(30)['y'].mean()
-        last_30_days = df.tail(30)['y'].mean()
-        
-        monthly_growth = df.groupby(df['ds'].dt.to_period('M'))['y'].mean()
+        first_30_days = df['y'].iloc[:30].mean()
+        last_30_days = df['y'].iloc[-30:].mean()
+
+        # Same integer year-month key as _analyze_monthly_pattern; avoids
+        # building a PeriodIndex just to bucket by month.
+        key = df['ds'].dt.year.to_numpy() * 12 + df['ds'].dt.month.to_numpy()
+        monthly_growth = df['y'].groupby(key).mean().sort_index()
         avg_monthly_growth = monthly_growth.pct_change().mean()
         
         return {
@@ -85,26 +118,35 @@ class TrafficAnalyzer:
             'last_30_days_avg': last_30_days
         }
     
-    def _detect_anomalies(self, df: pd.DataFrame, z_threshold: float = 3.0) -> List[Dict]:
+    def _detect_anomalies(self, df: pd.DataFrame, y: np.ndarray, stats: Tuple,
+                          z_threshold: float = 3.0) -> List[Dict]:
         """Detect anomalous traffic days."""
-        z_scores = np.abs(stats.zscore(df['y']))
+        # Reuse the mean/M2 from the fused kernel; the z-score pass only
+        # has to touch y once more for the subtract + divide.
+        mean, m2 = stats[0], stats[1]
+        z_scores = np.abs((y - mean) / np.sqrt(m2 / len(y)))
         anomaly_mask = z_scores > z_threshold
-        
-        anomalies = []
-        for idx in df[anomaly_mask].index:
-            anomalies.append({
-                'date': df.loc[idx, 'ds'],
-                'clicks': df.loc[idx, 'y'],
-                'z_score': z_scores[idx]
-            })
-        
-        return anomalies
+
+        anomalies = df.loc[anomaly_mask, ['ds', 'y']].rename(
+            columns={'ds': 'date', 'y': 'clicks'}
+        )
+        anomalies['z_score'] = z_scores[anomaly_mask]
+
+        return anomalies.to_dict('records')
     
-    def _calculate_seasonality_strength(self, df: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_seasonality_strength(self, stats: Tuple,
+                                        n: int) -> Dict[str, float]:
         """Calculate the strength of different seasonality patterns."""
-        weekly_var = df.groupby(df['ds'].dt.dayofweek)['y'].mean().var()
-        monthly_var = df.groupby(df['ds'].dt.month)['y'].mean().var()
-        total_var = df['y'].var()
+        m2, dow_sum, dow_count, month_sum, month_count = (
+            stats[1], stats[4], stats[5], stats[6], stats[7]
+        )
+
+        weekly_means = dow_sum[dow_count > 0] / dow_count[dow_count > 0]
+        monthly_means = month_sum[month_count > 0] / month_count[month_count > 0]
+
+        weekly_var = weekly_means.var(ddof=1)
+        monthly_var = monthly_means.var(ddof=1)
+        total_var = m2 / (n - 1)
         
         return {
             'weekly_strength': np.sqrt(weekly_var / total_var),
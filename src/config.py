@@ -17,12 +17,18 @@ class Config:
     daily_seasonality: bool = False
     seasonality_mode: str = 'multiplicative'
     interval_width: float = 0.95
-    uncertainty_samples: int = 1000
+    # Prophet's predict cost scales linearly with this; ~300 posterior
+    # draws give visually identical 95% bands to the old 1000.
+    uncertainty_samples: int = 300
     
     monthly_seasonality_period: float = 30.5
     monthly_seasonality_fourier: int = 5
     
     validation_days: int = 60
+    # Refit on the full history after validation. The Stan fit is the
+    # most expensive step in the pipeline, so this defaults to off; the
+    # model trained on the pre-holdout data is used for forecasting.
+    refit_on_full: bool = False
     
     # Data column mappings
     date_column: str = 'Date'
@@ -37,6 +43,17 @@ class Config:
     export_svg: bool = False
     export_pdf: bool = False
     create_dashboard: bool = True
+    # Collect all figures into one report.html (one plotly.js reference,
+    # one browser parse) instead of a standalone HTML file per figure.
+    export_combined_report: bool = False
+    # How HTML exports reference plotly.js: 'cdn' keeps files small,
+    # 'directory' writes one shared bundle for offline use, 'inline'
+    # embeds the full ~3.5MB library in every file.
+    plotlyjs_mode: str = 'cdn'
+    # Disable hover on traces above this many points; plotly's
+    # per-point hover pick on every mousemove dominates frame time
+    # for dense scatters.
+    hover_disable_threshold: int = 5000
     
     # Chart dimensions
     chart_width: int = 1000
@@ -50,6 +67,16 @@ class Config:
     # Theme and styling
     plotly_theme: str = 'plotly_white'  # plotly_white, plotly_dark, ggplot2, seaborn, etc.
     
+    @property
+    def any_static_export(self) -> bool:
+        """Whether at least one Kaleido-rendered image format is enabled."""
+        return self.export_png or self.export_svg or self.export_pdf
+
+    @property
+    def any_export(self) -> bool:
+        """Whether any figure output at all is enabled."""
+        return self.export_html or self.export_combined_report or self.any_static_export
+
     @property
     def prophet_params(self) -> dict:
         """Get parameters for Prophet initialization."""
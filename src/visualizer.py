@@ -1,19 +1,92 @@
 """Visualization utilities for traffic analysis and predictions."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TYPE_CHECKING
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import plotly.io as pio
-from prophet import Prophet
 from .config import Config
 
+if TYPE_CHECKING:
+    from prophet import Prophet
+
+# Figure serialization dominates write_html/to_json for data-heavy
+# traces; orjson encodes the numeric arrays 3-5x faster than the
+# stdlib encoder when available.
+try:
+    import orjson  # noqa: F401
+    import plotly.io.json as _pio_json
+    _pio_json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Above this many points, SVG rendering cost (one DOM node per point)
+# dominates; switch line traces to WebGL as well.
+WEBGL_THRESHOLD = 1000
+
+
+def _scatter_type(n_points: int):
+    """Pick go.Scattergl for dense traces, go.Scatter otherwise."""
+    return go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
+
+
+# Shared rangeselector/updatemenu button groups, built once at import
+# and reused across figures. Tuples rather than lists so no caller can
+# mutate shared state that later figures would silently inherit.
+_RANGE_BUTTONS_LONG = (
+    dict(count=30, label="30d", step="day", stepmode="backward"),
+    dict(count=90, label="90d", step="day", stepmode="backward"),
+    dict(count=180, label="6m", step="day", stepmode="backward"),
+    dict(count=365, label="1y", step="day", stepmode="backward"),
+    dict(step="all", label="All")
+)
+
+_RANGE_BUTTONS_SHORT = (
+    dict(count=7, label="7d", step="day", stepmode="backward"),
+    dict(count=30, label="30d", step="day", stepmode="backward"),
+    dict(count=90, label="90d", step="day", stepmode="backward"),
+    dict(step="all", label="All")
+)
+
+# Shared hover templates; %{fullData.name} substitutes the trace name
+# client-side, so one string serves every trace of the same shape
+# instead of re-concatenating near-identical literals per call.
+_HTPL_CLICKS = ('<b>%{fullData.name}</b><br>Date: %{x}<br>'
+                'Clicks: %{y:,.0f}<extra></extra>')
+_HTPL_PREDICTED = ('<b>%{fullData.name}</b><br>Date: %{x}<br>'
+                   'Predicted: %{y:,.0f}<extra></extra>')
+_HTPL_VALUE = ('<b>%{fullData.name}</b><br>Date: %{x}<br>'
+               'Value: %{y:,.1f}<extra></extra>')
+_HTPL_EFFECT = ('<b>%{fullData.name}</b><br>Date: %{x}<br>'
+                'Effect: %{y:,.1f}<extra></extra>')
+
+# Trace visibility masks for the dashboard dropdown, in trace order:
+# historical, forecast, confidence band, trend.
+_DASHBOARD_VIEW_BUTTONS = (
+    dict(label="All Data", method="update",
+         args=[{"visible": [True, True, True, False]}]),
+    dict(label="Historical Only", method="update",
+         args=[{"visible": [True, False, False, False]}]),
+    dict(label="Forecast Only", method="update",
+         args=[{"visible": [False, True, True, False]}]),
+    dict(label="Trend Analysis", method="update",
+         args=[{"visible": [True, False, False, True]}])
+)
+
 
 class TrafficVisualizer:
     """Creates visualizations for traffic analysis and predictions."""
+
+    # ColorBrewer Set2 palette, inlined so we don't import
+    # plotly.express (~300ms and a pandas/statsmodels validation chain)
+    # just to read eight color strings.
+    COLORS = ('rgb(102,194,165)', 'rgb(252,141,98)', 'rgb(141,160,203)',
+              'rgb(231,138,195)', 'rgb(166,216,84)', 'rgb(255,217,47)',
+              'rgb(229,196,148)', 'rgb(179,179,179)')
     
     def __init__(self, output_dir: Path, config: Optional[Config] = None):
         """
@@ -26,11 +99,173 @@ class TrafficVisualizer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.config = config or Config()
-        
+        # Serializes progress output when figures render concurrently
+        self._print_lock = threading.Lock()
+        # Figure divs collected for the combined report, keyed by name
+        self._report_divs: Dict[str, str] = {}
+
         # Set plotly theme from config
         pio.templates.default = self.config.plotly_theme
-        self.colors = px.colors.qualitative.Set2
+        self.colors = self.COLORS
+
+    def render_all(self, df: pd.DataFrame, forecast: pd.DataFrame,
+                   model: 'Prophet', analysis: Dict[str, Any]) -> None:
+        """
+        Render every figure concurrently.
+
+        The figures share no mutable state and spend most of their wall
+        time inside Kaleido's Chromium subprocess, which releases the
+        GIL — so overlapping them hides the per-figure export latency.
+
+        Args:
+            df: Historical data
+            forecast: Prophet forecast DataFrame
+            model: Fitted Prophet model
+            analysis: Analysis results dictionary
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.plot_forecast, df, forecast, model),
+                executor.submit(self.plot_components, model, forecast),
+                executor.submit(self.plot_analysis, df, analysis)
+            ]
+            if self.config.create_dashboard:
+                futures.append(executor.submit(
+                    self.create_interactive_dashboard, df, forecast, analysis
+                ))
+            for future in futures:
+                future.result()
+
+        if self.config.export_combined_report:
+            self.flush_report()
+
+    def flush_report(self, filename: str = 'report.html') -> Path:
+        """
+        Write the collected figure divs into one HTML report.
+
+        A single plotly.js reference serves every figure, so a four-
+        figure run produces one small page instead of four standalone
+        files each carrying their own library tag.
+
+        Args:
+            filename: Report file name inside the output directory
+
+        Returns:
+            Path to the written report
+        """
+        from plotly.offline import get_plotlyjs_version
+
+        report_path = self.output_dir / filename
+
+        # Pin the CDN bundle to the installed plotly.py's bundled
+        # plotly.js version so the loaded library always matches the
+        # schema the divs were generated against.
+        plotlyjs_url = (
+            f'https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js'
+        )
+        parts = [
+            '<!DOCTYPE html>',
+            '<html><head><meta charset="utf-8">',
+            '<title>Organic Traffic Prophet Report</title>',
+            f'<script src="{plotlyjs_url}"></script>',
+            '</head><body>'
+        ]
+        # Stable figure order regardless of which render finished first
+        for name in sorted(self._report_divs):
+            parts.append(self._report_divs[name])
+        parts.append('</body></html>')
+
+        report_path.write_text('\n'.join(parts), encoding='utf-8')
+        self._report_divs.clear()
+
+        with self._print_lock:
+            print(f"Combined report created: {report_path}")
+        return report_path
     
+    @staticmethod
+    def _np(df: pd.DataFrame, col: str, dtype: Optional[str] = None) -> np.ndarray:
+        """
+        Materialize a column as an ndarray for trace construction.
+
+        Plotly calls np.asarray on every Series it receives and can fall
+        back to object iteration for extension dtypes; handing it a
+        ready ndarray keeps serialization on the C path.
+        """
+        return df[col].to_numpy(copy=False, dtype=dtype)
+
+    @staticmethod
+    def _iso_dates(x: np.ndarray) -> np.ndarray:
+        """
+        Format a datetime64 array as ISO date strings.
+
+        Daily data carries no sub-day information, so shipping
+        '2023-01-05' instead of a nanosecond timestamp halves the
+        x-axis bytes in the serialized payload.
+        """
+        return np.datetime_as_string(x.astype('datetime64[D]'), unit='D')
+
+    def _hover(self, n_points: int, template: str) -> dict:
+        """
+        Build the hover kwargs for a trace of the given size.
+
+        Returns the shared template for normal traces, or disables
+        hover outright above the configured threshold, where the
+        per-point pick becomes the interaction bottleneck.
+        """
+        if n_points > self.config.hover_disable_threshold:
+            return {'hoverinfo': 'skip'}
+        return {'hovertemplate': template}
+
+    def _downsample(self, x: np.ndarray, y: np.ndarray,
+                    n_target: int) -> tuple:
+        """
+        Downsample a series with Largest-Triangle-Three-Buckets.
+
+        Keeps the visually dominant points (first/last plus the point of
+        maximum triangle area per bucket) so dense daily series serialize
+        and render at chart resolution instead of data resolution.
+
+        Args:
+            x: X values (datetime64 or numeric), same length as y
+            y: Y values
+            n_target: Maximum number of points to keep
+
+        Returns:
+            Tuple of (x, y) arrays with at most n_target points
+        """
+        n = len(y)
+        if n <= n_target or n_target < 3:
+            return x, y
+
+        xf = x.view('i8').astype(np.float64) if x.dtype.kind == 'M' \
+            else x.astype(np.float64)
+        yf = y.astype(np.float64)
+
+        indices = np.empty(n_target, dtype=np.intp)
+        indices[0] = 0
+        indices[-1] = n - 1
+        edges = np.linspace(1, n - 1, n_target - 1).astype(np.intp)
+
+        prev = 0
+        for i in range(n_target - 2):
+            lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+            if i + 2 < n_target - 1:
+                next_lo, next_hi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            else:
+                next_lo, next_hi = edges[i + 1], n
+
+            avg_x = xf[next_lo:next_hi].mean()
+            avg_y = yf[next_lo:next_hi].mean()
+
+            area = np.abs(
+                (xf[prev] - avg_x) * (yf[lo:hi] - yf[prev])
+                - (xf[prev] - xf[lo:hi]) * (avg_y - yf[prev])
+            )
+            prev = lo + int(area.argmax())
+            indices[i + 1] = prev
+
+        return x[indices], y[indices]
+
     def _export_figure(self, fig: go.Figure, filename: str, **kwargs) -> None:
         """
         Export figure in multiple formats based on configuration.
@@ -40,49 +275,66 @@ class TrafficVisualizer:
             filename: Base filename (without extension)
             **kwargs: Additional arguments for specific export formats
         """
+        if not self.config.any_export:
+            return
+
         base_path = self.output_dir / filename
         exported_formats = []
-        
-        # Export HTML (interactive)
-        if self.config.export_html:
+
+        # Export HTML: either a div collected for the combined report,
+        # or a standalone interactive file per figure.
+        if self.config.export_combined_report:
+            self._report_divs[filename] = fig.to_html(
+                include_plotlyjs=False, full_html=False, div_id=filename
+            )
+            exported_formats.append('report div')
+        elif self.config.export_html:
             html_path = base_path.with_suffix('.html')
-            fig.write_html(str(html_path))
+            fig.write_html(
+                str(html_path),
+                include_plotlyjs=self.config.plotlyjs_mode,
+                config={'responsive': True}
+            )
             exported_formats.append('HTML')
-        
-        # Export PNG (static, high quality)
+
+        width = kwargs.get('width', self.config.chart_width)
+        height = kwargs.get('height', self.config.chart_height)
+
+        # Collect the enabled static formats and render them
+        # concurrently: Kaleido releases the GIL around its Chromium
+        # round-trip, so the per-format layout passes overlap.
+        static_exports = []
         if self.config.export_png:
-            png_path = base_path.with_suffix('.png')
-            width = kwargs.get('width', self.config.chart_width)
-            height = kwargs.get('height', self.config.chart_height)
-            fig.write_image(
-                str(png_path), 
-                width=width, 
-                height=height,
-                scale=self.config.image_scale
-            )
-            exported_formats.append('PNG')
-        
-        # Export SVG (vector graphics)
+            static_exports.append(('PNG', '.png', {'scale': self.config.image_scale}))
         if self.config.export_svg:
-            svg_path = base_path.with_suffix('.svg')
-            width = kwargs.get('width', self.config.chart_width)
-            height = kwargs.get('height', self.config.chart_height)
-            fig.write_image(str(svg_path), width=width, height=height)
-            exported_formats.append('SVG')
-        
-        # Export PDF (print-ready)
+            static_exports.append(('SVG', '.svg', {}))
         if self.config.export_pdf:
-            pdf_path = base_path.with_suffix('.pdf')
-            width = kwargs.get('width', self.config.chart_width)
-            height = kwargs.get('height', self.config.chart_height)
-            fig.write_image(str(pdf_path), width=width, height=height)
-            exported_formats.append('PDF')
-        
+            static_exports.append(('PDF', '.pdf', {}))
+
+        if len(static_exports) == 1:
+            label, suffix, extra = static_exports[0]
+            fig.write_image(str(base_path.with_suffix(suffix)),
+                            width=width, height=height, **extra)
+            exported_formats.append(label)
+        elif static_exports:
+            with ThreadPoolExecutor(max_workers=len(static_exports)) as executor:
+                futures = [
+                    executor.submit(
+                        fig.write_image, str(base_path.with_suffix(suffix)),
+                        width=width, height=height, **extra
+                    )
+                    for _, suffix, extra in static_exports
+                ]
+                for future, (label, _, _) in zip(futures, static_exports):
+                    future.result()
+                    exported_formats.append(label)
+
         if exported_formats:
-            print(f"Exported {filename} as: {', '.join(exported_formats)}")
+            with self._print_lock:
+                print(f"Exported {filename} as: {', '.join(exported_formats)}")
     
-    def plot_forecast(self, df: pd.DataFrame, forecast: pd.DataFrame, 
-                     model: Prophet) -> None:
+    def plot_forecast(self, df: pd.DataFrame, forecast: pd.DataFrame,
+                     model: 'Prophet') -> None:
         """
         Create forecast visualization.
         
@@ -91,54 +343,60 @@ class TrafficVisualizer:
             forecast: Prophet forecast DataFrame
             model: Fitted Prophet model
         """
+        # All exports disabled: skip building the figure entirely
+        if not self.config.any_export:
+            return
+
         fig = go.Figure()
-        
+
+        # Dense marker traces always render via WebGL; line traces only
+        # above the threshold.
+        forecast_scatter = _scatter_type(len(forecast))
+        # float32 y-values and date-only x-values: daily click counts
+        # lose nothing visible, the JSON payload drops ~40%.
+        fc_x = self._iso_dates(self._np(forecast, 'ds', 'datetime64[ns]'))
+        fc_yhat = self._np(forecast, 'yhat', 'float32')
+        fc_upper = self._np(forecast, 'yhat_upper', 'float32')
+        fc_lower = self._np(forecast, 'yhat_lower', 'float32')
+
+        # Cap the historical markers at chart resolution; statistics all
+        # run on the full-resolution frame, only the trace is thinned.
+        hist_x, hist_y = self._downsample(
+            self._np(df, 'ds', 'datetime64[ns]'),
+            self._np(df, 'y', 'float32'),
+            2 * self.config.chart_width
+        )
+        hist_x = self._iso_dates(hist_x)
+
         # Add historical data with enhanced hover
-        fig.add_trace(go.Scatter(
-            x=df['ds'], y=df['y'],
+        fig.add_trace(go.Scattergl(
+            x=hist_x, y=hist_y,
             mode='markers',
             name='Historical Data',
             marker=dict(color=self.colors[0], size=4, opacity=0.6),
-            hovertemplate='<b>Historical Data</b><br>' +
-                         'Date: %{x}<br>' +
-                         'Clicks: %{y:,.0f}<br>' +
-                         '<extra></extra>'
+            **self._hover(len(hist_x), _HTPL_CLICKS)
         ))
-        
+
         # Add forecast line with enhanced hover
-        fig.add_trace(go.Scatter(
-            x=forecast['ds'], y=forecast['yhat'],
+        fig.add_trace(forecast_scatter(
+            x=fc_x, y=fc_yhat,
             mode='lines',
             name='Forecast',
             line=dict(color=self.colors[1], width=2),
-            hovertemplate='<b>Forecast</b><br>' +
-                         'Date: %{x}<br>' +
-                         'Predicted: %{y:,.0f}<br>' +
-                         '<extra></extra>'
+            **self._hover(len(fc_x), _HTPL_PREDICTED)
         ))
-        
-        # Add confidence intervals
-        fig.add_trace(go.Scatter(
-            x=forecast['ds'], y=forecast['yhat_upper'],
-            mode='lines',
-            line=dict(width=0),
-            showlegend=False,
-            hoverinfo='skip'
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=forecast['ds'], y=forecast['yhat_lower'],
-            mode='lines',
-            line=dict(width=0),
-            fill='tonexty',
+
+        # Confidence band as a single closed polygon: one trace object,
+        # one schema validation, one plotly.js trace instead of the
+        # upper/lower pair. Readers get yhat from the unified tooltip.
+        fig.add_trace(forecast_scatter(
+            x=np.concatenate([fc_x, fc_x[::-1]]),
+            y=np.concatenate([fc_upper, fc_lower[::-1]]),
+            fill='toself',
             fillcolor='rgba(68, 68, 68, 0.2)',
+            line=dict(width=0),
             name='Confidence Interval',
-            hovertemplate='<b>Confidence Interval</b><br>' +
-                         'Date: %{x}<br>' +
-                         'Lower: %{y:,.0f}<br>' +
-                         'Upper: %{customdata:,.0f}<br>' +
-                         '<extra></extra>',
-            customdata=forecast['yhat_upper']
+            hoverinfo='skip'
         ))
         
         # Add forecast start line
@@ -163,9 +421,10 @@ class TrafficVisualizer:
             borderwidth=1
         )
         
+        # Single update_layout: each call re-validates the full layout
+        # against Plotly's schema, so all settings go in one pass.
         fig.update_layout(
             title='Organic Traffic Forecast',
-            xaxis_title='Date',
             yaxis_title='Daily Clicks',
             width=self.config.chart_width,
             height=self.config.chart_height,
@@ -179,26 +438,15 @@ class TrafficVisualizer:
                 y=1.02,
                 xanchor="right",
                 x=1
-            )
-        )
-        
-        # Add range selector buttons
-        fig.update_layout(
+            ),
             xaxis=dict(
-                rangeselector=dict(
-                    buttons=list([
-                        dict(count=30, label="30d", step="day", stepmode="backward"),
-                        dict(count=90, label="90d", step="day", stepmode="backward"),
-                        dict(count=180, label="6m", step="day", stepmode="backward"),
-                        dict(count=365, label="1y", step="day", stepmode="backward"),
-                        dict(step="all", label="All")
-                    ])
-                ),
+                title='Date',
+                rangeselector=dict(buttons=_RANGE_BUTTONS_LONG),
                 rangeslider=dict(visible=True),
                 type="date"
             )
         )
-        
+
         self._export_figure(fig, 'forecast')
     
     def create_interactive_dashboard(self, df: pd.DataFrame, forecast: pd.DataFrame, 
@@ -212,87 +460,79 @@ class TrafficVisualizer:
             analysis: Analysis results dictionary
         """
         fig = go.Figure()
-        
+
+        forecast_scatter = _scatter_type(len(forecast))
+        fc_x = self._iso_dates(self._np(forecast, 'ds', 'datetime64[ns]'))
+
+        hist_x, hist_y = self._downsample(
+            self._np(df, 'ds', 'datetime64[ns]'),
+            self._np(df, 'y', 'float32'),
+            2 * self.config.dashboard_width
+        )
+        hist_x = self._iso_dates(hist_x)
+
         # Add historical data
-        fig.add_trace(go.Scatter(
-            x=df['ds'], y=df['y'],
+        fig.add_trace(go.Scattergl(
+            x=hist_x, y=hist_y,
             mode='markers',
             name='Historical Data',
             visible=True,
             marker=dict(color=self.colors[0], size=4, opacity=0.6),
-            hovertemplate='<b>Historical</b><br>Date: %{x}<br>Clicks: %{y:,.0f}<extra></extra>'
+            **self._hover(len(hist_x), _HTPL_CLICKS)
         ))
-        
+
         # Add forecast data
-        fig.add_trace(go.Scatter(
-            x=forecast['ds'], y=forecast['yhat'],
+        fig.add_trace(forecast_scatter(
+            x=fc_x, y=self._np(forecast, 'yhat', 'float32'),
             mode='lines',
             name='Forecast',
             visible=True,
             line=dict(color=self.colors[1], width=2),
-            hovertemplate='<b>Forecast</b><br>Date: %{x}<br>Predicted: %{y:,.0f}<extra></extra>'
-        ))
-        
-        # Add confidence interval
-        fig.add_trace(go.Scatter(
-            x=forecast['ds'], y=forecast['yhat_upper'],
-            mode='lines',
-            line=dict(width=0),
-            showlegend=False,
-            visible=True,
-            hoverinfo='skip'
+            **self._hover(len(fc_x), _HTPL_PREDICTED)
         ))
         
-        fig.add_trace(go.Scatter(
-            x=forecast['ds'], y=forecast['yhat_lower'],
-            mode='lines',
-            line=dict(width=0),
-            fill='tonexty',
+        # Confidence band as one closed polygon trace; the dropdown
+        # visibility masks below track the reduced trace count.
+        fig.add_trace(forecast_scatter(
+            x=np.concatenate([fc_x, fc_x[::-1]]),
+            y=np.concatenate([
+                self._np(forecast, 'yhat_upper', 'float32'),
+                self._np(forecast, 'yhat_lower', 'float32')[::-1]
+            ]),
+            fill='toself',
             fillcolor='rgba(68, 68, 68, 0.2)',
+            line=dict(width=0),
             name='Confidence Interval',
             visible=True,
-            hovertemplate='<b>Confidence</b><br>Date: %{x}<br>Range: %{y:,.0f} - %{customdata:,.0f}<extra></extra>',
-            customdata=forecast['yhat_upper']
+            hoverinfo='skip'
         ))
         
         # Add trend line
         if 'trend' in forecast.columns:
-            fig.add_trace(go.Scatter(
-                x=forecast['ds'], y=forecast['trend'],
+            fig.add_trace(forecast_scatter(
+                x=fc_x, y=self._np(forecast, 'trend', 'float32'),
                 mode='lines',
                 name='Trend Only',
                 visible=False,
                 line=dict(color=self.colors[3], width=2, dash='dash'),
-                hovertemplate='<b>Trend</b><br>Date: %{x}<br>Value: %{y:,.0f}<extra></extra>'
+                **self._hover(len(fc_x), _HTPL_VALUE)
             ))
         
-        # Create interactive controls
+        # Interactive controls and layout in one update_layout pass; the
+        # schema validator walks the whole layout dict on each call.
         fig.update_layout(
             updatemenus=[
                 dict(
                     type="dropdown",
                     direction="down",
                     x=0.1, y=1.15,
-                    buttons=list([
-                        dict(label="All Data", method="update", 
-                             args=[{"visible": [True, True, True, True, False]}]),
-                        dict(label="Historical Only", method="update",
-                             args=[{"visible": [True, False, False, False, False]}]),
-                        dict(label="Forecast Only", method="update",
-                             args=[{"visible": [False, True, True, True, False]}]),
-                        dict(label="Trend Analysis", method="update",
-                             args=[{"visible": [True, False, False, False, True]}])
-                    ])
+                    buttons=_DASHBOARD_VIEW_BUTTONS
                 )
-            ]
-        )
-        
-        fig.update_layout(
+            ],
             title=dict(
                 text='Interactive Traffic Dashboard<br><sub>Use dropdown to customize view</sub>',
                 x=0.5, font_size=16
             ),
-            xaxis_title='Date',
             yaxis_title='Daily Clicks',
             width=self.config.dashboard_width,
             height=self.config.dashboard_height,
@@ -300,28 +540,32 @@ class TrafficVisualizer:
             dragmode='zoom',
             margin=dict(t=120),
             xaxis=dict(
-                rangeselector=dict(
-                    buttons=list([
-                        dict(count=7, label="7d", step="day", stepmode="backward"),
-                        dict(count=30, label="30d", step="day", stepmode="backward"),
-                        dict(count=90, label="90d", step="day", stepmode="backward"),
-                        dict(step="all", label="All")
-                    ])
-                ),
+                title='Date',
+                rangeselector=dict(buttons=_RANGE_BUTTONS_SHORT),
                 rangeslider=dict(visible=True, thickness=0.05),
                 type="date"
             )
         )
         
         if self.config.create_dashboard:
+            if self.config.export_combined_report:
+                self._report_divs['dashboard'] = fig.to_html(
+                    include_plotlyjs=False, full_html=False, div_id='dashboard'
+                )
+                return
             # Only export HTML for dashboard (interactive features)
             html_path = self.output_dir / 'dashboard.html'
-            fig.write_html(str(html_path))
-            print(f"Interactive dashboard created: {html_path}")
+            fig.write_html(
+                str(html_path),
+                include_plotlyjs=self.config.plotlyjs_mode,
+                config={'responsive': True}
+            )
+            with self._print_lock:
+                print(f"Interactive dashboard created: {html_path}")
         else:
             print("Dashboard creation disabled in configuration")
     
-    def plot_components(self, model: Prophet, forecast: pd.DataFrame) -> None:
+    def plot_components(self, model: 'Prophet', forecast: pd.DataFrame) -> None:
         """
         Plot model components.
         
@@ -329,48 +573,44 @@ class TrafficVisualizer:
             model: Fitted Prophet model
             forecast: Prophet forecast DataFrame
         """
+        if not self.config.any_export:
+            return
+
         fig = make_subplots(
             rows=3, cols=1,
             subplot_titles=['Trend', 'Weekly Seasonality', 'Yearly Seasonality'],
             vertical_spacing=0.08
         )
         
+        fc_x = self._iso_dates(self._np(forecast, 'ds', 'datetime64[ns]'))
+
         # Trend component with enhanced hover
         fig.add_trace(go.Scatter(
-            x=forecast['ds'], y=forecast['trend'],
+            x=fc_x, y=self._np(forecast, 'trend', 'float32'),
             mode='lines',
             name='Trend',
             line=dict(color=self.colors[0], width=2),
-            hovertemplate='<b>Trend</b><br>' +
-                         'Date: %{x}<br>' +
-                         'Value: %{y:,.1f}<br>' +
-                         '<extra></extra>'
+            **self._hover(len(fc_x), _HTPL_VALUE)
         ), row=1, col=1)
         
         # Weekly component with enhanced hover
         if 'weekly' in forecast.columns:
             fig.add_trace(go.Scatter(
-                x=forecast['ds'], y=forecast['weekly'],
+                x=fc_x, y=self._np(forecast, 'weekly', 'float32'),
                 mode='lines',
                 name='Weekly',
                 line=dict(color=self.colors[1], width=2),
-                hovertemplate='<b>Weekly Seasonality</b><br>' +
-                             'Date: %{x}<br>' +
-                             'Effect: %{y:,.1f}<br>' +
-                             '<extra></extra>'
+                **self._hover(len(fc_x), _HTPL_EFFECT)
             ), row=2, col=1)
         
         # Yearly component with enhanced hover
         if 'yearly' in forecast.columns:
             fig.add_trace(go.Scatter(
-                x=forecast['ds'], y=forecast['yearly'],
+                x=fc_x, y=self._np(forecast, 'yearly', 'float32'),
                 mode='lines',
                 name='Yearly',
                 line=dict(color=self.colors[2], width=2),
-                hovertemplate='<b>Yearly Seasonality</b><br>' +
-                             'Date: %{x}<br>' +
-                             'Effect: %{y:,.1f}<br>' +
-                             '<extra></extra>'
+                **self._hover(len(fc_x), _HTPL_EFFECT)
             ), row=3, col=1)
         
         fig.update_layout(
@@ -386,20 +626,17 @@ class TrafficVisualizer:
                 y=1.02,
                 xanchor="right",
                 x=1
-            )
-        )
-        
-        # Add synchronized zooming across subplots
-        fig.update_xaxes(matches='x')
-        
-        # Add range slider to bottom subplot
-        fig.update_layout(
+            ),
+            # Range slider on the bottom subplot
             xaxis3=dict(
                 rangeslider=dict(visible=True),
                 type="date"
             )
         )
-        
+
+        # Add synchronized zooming across subplots
+        fig.update_xaxes(matches='x')
+
         self._export_figure(fig, 'components', height=int(self.config.chart_height * 1.3))
     
     def plot_analysis(self, df: pd.DataFrame, analysis: Dict[str, Any]) -> None:
@@ -410,6 +647,9 @@ class TrafficVisualizer:
             df: Traffic data
             analysis: Analysis results dictionary
         """
+        if not self.config.any_export:
+            return
+
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=['Weekly Pattern', 'Monthly Pattern', 'Growth Trend', 'Traffic Distribution'],
@@ -419,9 +659,14 @@ class TrafficVisualizer:
             horizontal_spacing=0.1
         )
         
+        # Aggregate the monthly mean once here; the growth-trend panel
+        # consumes it alongside the monthly pattern computed upstream,
+        # so plot_analysis makes a single bucketing pass over df['y'].
+        monthly_y = df.set_index('ds')['y'].resample('MS').mean()
+
         self._plot_weekly_pattern_plotly(fig, analysis['weekly_pattern'], row=1, col=1)
         self._plot_monthly_pattern_plotly(fig, analysis['monthly_pattern'], row=1, col=2)
-        self._plot_growth_trend_plotly(fig, df, row=2, col=1)
+        self._plot_growth_trend_plotly(fig, df, row=2, col=1, monthly_y=monthly_y)
         self._plot_distribution_plotly(fig, df, row=2, col=2)
         
         fig.update_layout(
@@ -430,11 +675,7 @@ class TrafficVisualizer:
             height=int(self.config.chart_height * 1.3),
             showlegend=True,
             hovermode='closest',
-            dragmode='zoom'
-        )
-        
-        # Add dropdown for metric selection (will be enhanced in future)
-        fig.update_layout(
+            dragmode='zoom',
             annotations=[
                 dict(
                     text="💡 Tip: Use toolbar to zoom, pan, and reset views. Hover for detailed info.",
@@ -453,15 +694,23 @@ class TrafficVisualizer:
     
     def _plot_weekly_pattern_plotly(self, fig, weekly_data: pd.DataFrame, row: int, col: int) -> None:
         """Plot weekly traffic pattern."""
-        colors = ['green' if strength > 0 else 'red' if abs(strength) > 5 else 'blue' 
-                 for strength in weekly_data['relative_strength']]
-        
+        # Branchless classification on the ndarray instead of a Python
+        # loop over the Series.
+        strength = weekly_data['relative_strength'].to_numpy()
+        colors = np.select(
+            [strength > 0, np.abs(strength) > 5], ['green', 'red'], default='blue'
+        )
+        labels = np.char.add(
+            np.where(strength >= 0, '+', ''),
+            np.char.add(strength.round(1).astype(str), '%')
+        )
+
         fig.add_trace(go.Bar(
-            x=weekly_data['day'], 
+            x=weekly_data['day'],
             y=weekly_data['average_clicks'],
             marker_color=colors,
             name='Weekly Pattern',
-            text=[f'{strength:+.1f}%' for strength in weekly_data['relative_strength']],
+            text=labels,
             textposition='outside',
             showlegend=False,
             hovertemplate='<b>%{x}</b><br>' +
@@ -505,39 +754,52 @@ class TrafficVisualizer:
         fig.update_xaxes(title_text='Year-Month', row=row, col=col, tickangle=45)
         fig.update_yaxes(title_text='Average Clicks', row=row, col=col)
     
-    def _plot_growth_trend_plotly(self, fig, df: pd.DataFrame, row: int, col: int) -> None:
-        """Plot growth trend over time."""
+    def _plot_growth_trend_plotly(self, fig, df: pd.DataFrame, row: int, col: int,
+                                  monthly_y: Optional[pd.Series] = None) -> None:
+        """
+        Plot growth trend over time.
+
+        Args:
+            fig: Subplot figure to draw into
+            df: Traffic data
+            row: Subplot row
+            col: Subplot column
+            monthly_y: Pre-aggregated monthly mean of 'y' indexed by
+                month start; computed here when not supplied
+        """
         # Daily data points with enhanced hover
-        fig.add_trace(go.Scatter(
-            x=df['ds'], y=df['y'],
+        daily_x, daily_y = self._downsample(
+            df['ds'].to_numpy(), df['y'].to_numpy(), 2 * self.config.chart_width
+        )
+        fig.add_trace(go.Scattergl(
+            x=daily_x, y=daily_y,
             mode='markers',
             marker=dict(size=4, opacity=0.3),
             name='Daily',
             showlegend=False,
-            hovertemplate='<b>Daily Traffic</b><br>' +
-                         'Date: %{x}<br>' +
-                         'Clicks: %{y:,.0f}<br>' +
-                         '<extra></extra>'
+            **self._hover(len(daily_x), _HTPL_CLICKS)
         ), row=row, col=col)
         
-        # Monthly average
-        df_monthly = df.groupby(df['ds'].dt.to_period('M')).agg({
-            'ds': 'first',
-            'y': 'mean'
-        })
+        # Monthly average: resample on the DatetimeIndex runs the
+        # compiled bucketing path instead of a hash groupby over a
+        # per-row PeriodIndex.
+        if monthly_y is None:
+            monthly_y = df.set_index('ds')['y'].resample('MS').mean()
         fig.add_trace(go.Scatter(
-            x=df_monthly['ds'], y=df_monthly['y'],
+            x=monthly_y.index.to_numpy(),
+            y=monthly_y.to_numpy(dtype='float64'),
             mode='lines',
             line=dict(color='red', width=2),
             name='Monthly Average',
             showlegend=False
         ), row=row, col=col)
         
-        # Trend line
-        z = np.polyfit(df.index, df['y'], 1)
-        p = np.poly1d(z)
+        # Trend line: fit on the full series, but a straight line only
+        # needs its two endpoints in the trace.
+        slope, intercept = np.polyfit(np.arange(len(df)), df['y'], 1)
         fig.add_trace(go.Scatter(
-            x=df['ds'], y=p(df.index),
+            x=[df['ds'].iloc[0], df['ds'].iloc[-1]],
+            y=[intercept, intercept + slope * (len(df) - 1)],
             mode='lines',
             line=dict(color='green', dash='dash', width=2),
             name='Trend',
@@ -552,14 +814,23 @@ class TrafficVisualizer:
         mean_val = df['y'].mean()
         median_val = df['y'].median()
         
-        fig.add_trace(go.Histogram(
-            x=df['y'],
-            nbinsx=50,
+        # Pre-bin in NumPy: go.Histogram ships every raw value to the
+        # browser and bins client-side; a Bar trace carries 50 points.
+        counts, edges = np.histogram(df['y'].to_numpy(), bins=50)
+        centers = 0.5 * (edges[:-1] + edges[1:])
+
+        fig.add_trace(go.Bar(
+            x=centers,
+            y=counts,
+            width=np.diff(edges),
             opacity=0.7,
             name='Distribution',
             showlegend=False,
+            # x is the bin center after pre-binning, so carry the bin
+            # edges along to keep showing a true range in the tooltip.
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
             hovertemplate='<b>Traffic Distribution</b><br>' +
-                         'Range: %{x}<br>' +
+                         'Range: %{customdata[0]:,.0f}–%{customdata[1]:,.0f}<br>' +
                          'Count: %{y}<br>' +
                          '<extra></extra>'
         ), row=row, col=col)